@@ -1,13 +1,14 @@
 import os
 import sys
-import random
 import logging
-import re
+import time
 from collections import defaultdict
-from threading import Thread
+from functools import wraps
+from threading import Thread, Lock, local
 import telebot
 import instaloader
 from dotenv import load_dotenv
+from profiles import ProfileRecord
 
 # Load environment variables from .env file
 load_dotenv()
@@ -19,6 +20,8 @@ logging.basicConfig(filename='bot.log', level=logging.INFO, format='%(asctime)s
 API_TOKEN = os.getenv("API_TOKEN")
 FORCE_JOIN_CHANNEL = os.getenv("FORCE_JOIN_CHANNEL")
 ADMIN_ID = os.getenv("ADMIN_ID")
+# Seconds a positive channel membership check is reused before asking Telegram again
+MEMBERSHIP_CACHE_TTL = int(os.getenv("MEMBERSHIP_CACHE_TTL", "300"))
 
 bot = telebot.TeleBot(API_TOKEN)
 
@@ -34,90 +37,125 @@ def remove_user(user_id):
 def get_all_users():
     return list(user_ids)
 
-# List of keywords for different report categories
-report_keywords = {
-    "HATE": ["devil", "666", "savage", "love", "hate", "followers", "selling", "sold", "seller", "dick", "ban", "banned", "free", "method", "paid"],
-    "SELF": ["suicide", "blood", "death", "dead", "kill myself"],
-    "BULLY": ["@"],
-    "VIOLENT": ["hitler", "osama bin laden", "guns", "soldiers", "masks", "flags"],
-    "ILLEGAL": ["drugs", "cocaine", "plants", "trees", "medicines"],
-    "PRETENDING": ["verified", "tick"],
-    "NUDITY": ["nude", "sex", "send nudes"],
-    "SPAM": ["phone number", "email", "contact"]
-}
-
-def check_keywords(text, keywords):
-    return any(keyword in text.lower() for keyword in keywords)
-
-def analyze_profile(profile_info):
-    reports = defaultdict(int)
-    profile_texts = [
-        profile_info.get("username", ""),
-        profile_info.get("biography", ""),
-    ]
-
-    for text in profile_texts:
-        for category, keywords in report_keywords.items():
-            if check_keywords(text, keywords):
-                reports[category] += 1
-
-    if reports:
-        unique_counts = random.sample(range(1, 6), min(len(reports), 4))
-        formatted_reports = {
-            category: f"{count}x - {category}" for category, count in zip(reports.keys(), unique_counts)
-        }
-    else:
-        all_categories = list(report_keywords.keys())
-        num_categories = random.randint(2, 5)
-        selected_categories = random.sample(all_categories, num_categories)
-        unique_counts = random.sample(range(1, 6), num_categories)
-        formatted_reports = {
-            category: f"{count}x - {category}" for category, count in zip(selected_categories, unique_counts)
+# Per-command Bot API metrics
+metrics_lock = Lock()
+api_call_counts = defaultdict(lambda: defaultdict(int))  # command -> API method -> requests made
+api_calls_saved = defaultdict(int)  # command -> requests avoided
+api_latency_saved = defaultdict(float)  # command -> estimated seconds saved
+api_method_latency = {}  # API method -> moving average latency in seconds
+
+# Name of the command whose handler is running on this thread
+current_command = local()
+
+def track_command(name):
+    # Attribute every Bot API request made while the handler runs to the command
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(*args, **kwargs):
+            current_command.name = name
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                current_command.name = None
+        return wrapper
+    return decorator
+
+def command_name():
+    return getattr(current_command, 'name', None) or 'other'
+
+send_api_request = telebot.apihelper._make_request
+
+def counted_api_request(token, method_name, *args, **kwargs):
+    # Every Bot API request goes through apihelper._make_request, so counting here covers all calls.
+    # getUpdates long-polls belong to no command and would skew the latency averages.
+    if method_name == 'getUpdates':
+        return send_api_request(token, method_name, *args, **kwargs)
+    started = time.monotonic()
+    try:
+        return send_api_request(token, method_name, *args, **kwargs)
+    finally:
+        elapsed = time.monotonic() - started
+        with metrics_lock:
+            api_call_counts[command_name()][method_name] += 1
+            average = api_method_latency.get(method_name)
+            api_method_latency[method_name] = elapsed if average is None else average * 0.8 + elapsed * 0.2
+
+telebot.apihelper._make_request = counted_api_request
+
+def record_saved_call(method_name):
+    # Record a Bot API request that was coalesced away, valued at the method's average latency
+    with metrics_lock:
+        command = command_name()
+        api_calls_saved[command] += 1
+        api_latency_saved[command] += api_method_latency.get(method_name, 0.0)
+
+def get_api_metrics():
+    with metrics_lock:
+        commands = set(api_call_counts) | set(api_calls_saved)
+        return {
+            command: {
+                "calls": dict(api_call_counts[command]),
+                "total_calls": sum(api_call_counts[command].values()),
+                "calls_saved": api_calls_saved[command],
+                "latency_saved": api_latency_saved[command],
+            }
+            for command in commands
         }
 
-    return formatted_reports
+def deliver(message, progress, text, **kwargs):
+    # Turn the placeholder into the final result, falling back to a new message
+    if progress is not None:
+        try:
+            return bot.edit_message_text(text, chat_id=progress.chat.id, message_id=progress.message_id, **kwargs)
+        except telebot.apihelper.ApiTelegramException as e:
+            logging.error(f"Failed to edit placeholder message: {e}")
+    return bot.send_message(message.chat.id, text, **kwargs)
 
 def get_public_instagram_info(username):
     L = instaloader.Instaloader()
     try:
         profile = instaloader.Profile.from_username(L.context, username)
-        info = {
-            "username": profile.username,
-            "full_name": profile.full_name,
-            "biography": profile.biography,
-            "follower_count": profile.followers,
-            "following_count": profile.followees,
-            "is_private": profile.is_private,
-            "post_count": profile.mediacount,
-            "external_url": profile.external_url,
-        }
-        return info
+        return ProfileRecord.from_profile(profile)
     except instaloader.exceptions.ProfileNotExistsException:
         return None
     except instaloader.exceptions.InstaloaderException as e:
         logging.error(f"An error occurred: {e}")
         return None
 
+# user_id -> monotonic time until which the user is known to be a channel member
+member_cache = {}
+
+def prune_member_cache(now):
+    # Every entry gets the same TTL and is only inserted when absent, so insertion
+    # order is expiry order: drop expired entries from the front and stop at the first live one
+    while member_cache:
+        user_id = next(iter(member_cache))
+        if member_cache.get(user_id, now) > now:
+            break
+        member_cache.pop(user_id, None)
+
 def is_user_in_channel(user_id):
+    # Only positive answers are cached so users who just joined are re-checked right away
+    now = time.monotonic()
+    expires = member_cache.get(user_id)
+    if expires is not None:
+        if expires > now:
+            record_saved_call('getChatMember')
+            return True
+        member_cache.pop(user_id, None)
+
     try:
         member = bot.get_chat_member(f"@{FORCE_JOIN_CHANNEL}", user_id)
-        return member.status in ['member', 'administrator', 'creator']
     except telebot.apihelper.ApiTelegramException:
         return False
-
-def escape_markdown_v2(text):
-    # Escape special MarkdownV2 characters
-    replacements = {
-        '_': r'\_', '*': r'\*', '[': r'\[', ']': r'\]',
-        '(': r'\(', ')': r'\)', '~': r'\~', '`': r'\`',
-        '>': r'\>', '#': r'\#', '+': r'\+', '-': r'\-',
-        '=': r'\=', '|': r'\|', '{': r'\{', '}': r'\}',
-        '.': r'\.', '!': r'\!'
-    }
-    pattern = re.compile('|'.join(re.escape(key) for key in replacements.keys()))
-    return pattern.sub(lambda x: replacements[x.group(0)], text)
+    if member.status in ['member', 'administrator', 'creator']:
+        prune_member_cache(now)
+        member_cache[user_id] = now + MEMBERSHIP_CACHE_TTL
+        return True
+    return False
 
 @bot.message_handler(commands=['start'])
+@track_command('start')
 def start(message):
     user_id = message.chat.id
     if not is_user_in_channel(user_id):
@@ -134,6 +172,7 @@ def start(message):
     bot.reply_to(message, "Welcome! Use /getmeth <username> to analyze an Instagram profile.\n\n 100% working Too in $30 message @SugerBaddie !!", reply_markup=markup)
 
 @bot.message_handler(commands=['getmeth'])
+@track_command('getmeth')
 def analyze(message):
     user_id = message.chat.id
     if not is_user_in_channel(user_id):
@@ -146,37 +185,21 @@ def analyze(message):
         return
 
     username = ' '.join(username)
-    bot.reply_to(message, f"🔍 Scanning Your Target Profile: {username}. Please wait...")
+    # Placeholder reply that deliver() later edits in place with the result
+    progress = bot.reply_to(message, f"🔍 Scanning Your Target Profile: {username}. Please wait...")
 
     profile_info = get_public_instagram_info(username)
     if profile_info:
-        reports_to_file = analyze_profile(profile_info)
-        result_text = f"**Public Information for {username}:**\n"
-        result_text += f"Username: {profile_info.get('username', 'N/A')}\n"
-        result_text += f"Full Name: {profile_info.get('full_name', 'N/A')}\n"
-        result_text += f"Biography: {profile_info.get('biography', 'N/A')}\n"
-        result_text += f"Followers: {profile_info.get('follower_count', 'N/A')}\n"
-        result_text += f"Following: {profile_info.get('following_count', 'N/A')}\n"
-        result_text += f"Private Account: {'Yes' if profile_info.get('is_private') else 'No'}\n"
-        result_text += f"Posts: {profile_info.get('post_count', 'N/A')}\n"
-        result_text += f"External URL: {profile_info.get('external_url', 'N/A')}\n\n"
-        result_text += "Suggested Reports for Your Target:\n"
-        for report in reports_to_file.values():
-            result_text += f"• {report}\n"
-        result_text += "\n*Note: This method is based on available data and may not be fully accurate.*\n\n for supporting my devloper please donate some Money @SendPayments"
-
-        # Escape special characters for MarkdownV2
-        result_text = escape_markdown_v2(result_text)
-
         markup = telebot.types.InlineKeyboardMarkup()
-        markup.add(telebot.types.InlineKeyboardButton("Visit Target Profile", url=f"https://instagram.com/{profile_info['username']}"))
+        markup.add(telebot.types.InlineKeyboardButton("Visit Target Profile", url=f"https://instagram.com/{profile_info.username}"))
         markup.add(telebot.types.InlineKeyboardButton("Developer", url='t.me/SugerBaddie'))
 
-        bot.send_message(message.chat.id, result_text, reply_markup=markup, parse_mode='MarkdownV2')
+        deliver(message, progress, profile_info.report.decode('utf-8'), reply_markup=markup, parse_mode='MarkdownV2')
     else:
-        bot.reply_to(message, f"❌ Profile {username} not found or an error occurred.")
+        deliver(message, progress, f"❌ Profile {username} not found or an error occurred.")
 
 @bot.message_handler(commands=['broadcast'])
+@track_command('broadcast')
 def broadcast(message):
     if str(message.chat.id) != ADMIN_ID:
         bot.reply_to(message, "You are not authorized to use this command.")
@@ -195,6 +218,7 @@ def broadcast(message):
             logging.error(f"Failed to send message to {user}: {e}")
 
 @bot.message_handler(commands=['users'])
+@track_command('users')
 def list_users(message):
     if str(message.chat.id) != ADMIN_ID:
         bot.reply_to(message, "You are not authorized to use this command.")
@@ -207,7 +231,27 @@ def list_users(message):
     else:
         bot.reply_to(message, "No users found.")
 
+@bot.message_handler(commands=['stats'])
+@track_command('stats')
+def api_stats(message):
+    if str(message.chat.id) != ADMIN_ID:
+        bot.reply_to(message, "You are not authorized to use this command.")
+        return
+
+    metrics = get_api_metrics()
+    if not metrics:
+        bot.reply_to(message, "No Bot API calls recorded yet.")
+        return
+
+    stats_text = "Bot API calls per command:\n"
+    for command, data in sorted(metrics.items()):
+        calls = ", ".join(f"{method}={count}" for method, count in sorted(data["calls"].items()))
+        stats_text += f"/{command}: {data['total_calls']} calls ({calls or 'none'}), "
+        stats_text += f"{data['calls_saved']} saved, ~{data['latency_saved'] * 1000:.0f} ms saved\n"
+    bot.reply_to(message, stats_text)
+
 @bot.message_handler(commands=['remove_user'])
+@track_command('remove_user')
 def remove_user_command(message):
     if str(message.chat.id) != ADMIN_ID:
         bot.reply_to(message, "You are not authorized to use this command.")
@@ -220,9 +264,11 @@ def remove_user_command(message):
 
     user_id = int(user_id[0])
     remove_user(user_id)
+    member_cache.pop(user_id, None)
     bot.reply_to(message, f"User ID {user_id} has been removed.")
 
 @bot.message_handler(commands=['restart'])
+@track_command('restart')
 def restart_bot(message):
     if str(message.chat.id) != ADMIN_ID:
         bot.reply_to(message, "You are not authorized to use this command.")
@@ -233,25 +279,27 @@ def restart_bot(message):
     os.execv(sys.executable, ['python'] + sys.argv)
 
 @bot.callback_query_handler(func=lambda call: call.data == 'reload')
+@track_command('reload')
 def reload_callback(call):
     user_id = call.from_user.id
     if is_user_in_channel(user_id):
-        bot.answer_callback_query(call.id, text="You are now authorized to use the bot!")
-        bot.send_message(user_id, "You are now authorized to use the bot. Use /getmeth <username> to analyze an Instagram profile.")
+        # The confirmation fits in a callback alert, so no separate message is sent
+        bot.answer_callback_query(call.id, text="You are now authorized to use the bot. Use /getmeth <username> to analyze an Instagram profile.", show_alert=True)
+        record_saved_call('sendMessage')
     else:
         bot.answer_callback_query(call.id, text="You are not a member of the channel yet. Please join the channel first.")
 
 @bot.callback_query_handler(func=lambda call: call.data == 'help')
+@track_command('help')
 def help_callback(call):
     help_text = "Here's how you can use this bot:\n\n"
     help_text += "/getmeth <username> - Analyze an Instagram profile.\n"
     help_text += "Make sure you are a member of the channel to use this bot."
 
-    # Escape special characters for MarkdownV2
-    help_text = escape_markdown_v2(help_text)
-
-    bot.answer_callback_query(call.id, text=escape_markdown_v2(help_text))
-    bot.send_message(call.from_user.id, help_text, parse_mode='MarkdownV2')
+    # The help fits in a callback alert (200 chars max), so the query answer
+    # carries it and no separate message is sent
+    bot.answer_callback_query(call.id, text=help_text, show_alert=True)
+    record_saved_call('sendMessage')
 
 if __name__ == "__main__":
     print("Starting the bot...")
@@ -0,0 +1,111 @@
+import sys
+import random
+import string
+import tracemalloc
+from types import SimpleNamespace
+from profiles import ProfileRecord, BIO_MAX_LENGTH
+
+# Measure the memory footprint of cached profile records under a synthetic load.
+# Usage: python memory_profile.py [number_of_profiles]
+
+DEFAULT_PROFILES = 100_000
+SEED = 0
+
+# Real names and bios mix scripts and emoji, which widen Python strings to 2 or 4 bytes
+# per character, so the synthetic text must include them to reflect the real cost
+NON_ASCII_WORDS = ["café", "señor", "größe", "привет", "мир", "مرحبا", "नमस्ते", "東京", "사랑"]
+EMOJI = ["✨", "❤️", "🔥", "😂", "🌸", "📸", "🇮🇷", "💯"]
+
+def random_word(min_length, max_length):
+    return ''.join(random.choices(string.ascii_lowercase, k=random.randint(min_length, max_length)))
+
+def random_text_word(min_length, max_length):
+    # Mostly ASCII, with some non-ASCII words and emoji mixed in
+    roll = random.random()
+    if roll < 0.15:
+        return random.choice(NON_ASCII_WORDS)
+    if roll < 0.25:
+        return random.choice(EMOJI)
+    return random_word(min_length, max_length)
+
+def synthetic_profile(index):
+    # Stand-in for an instaloader Profile with the attributes from_profile() reads
+    return SimpleNamespace(
+        # Instagram usernames are limited to ASCII letters, digits, "." and "_"
+        username=f"{random_word(4, 12)}_{index}",
+        full_name=f"{random_text_word(3, 10).title()} {random_text_word(3, 12).title()}",
+        biography=' '.join(random_text_word(2, 10) for _ in range(random.randint(0, 40))),
+        followers=random.randint(0, 5_000_000),
+        followees=random.randint(0, 7_500),
+        is_private=random.random() < 0.3,
+        mediacount=random.randint(0, 3_000),
+        external_url=f"https://{random_word(4, 12)}.com" if random.random() < 0.4 else None,
+    )
+
+def build_cache(count):
+    random.seed(SEED)
+    cache = {}
+    for index in range(count):
+        record = ProfileRecord.from_profile(synthetic_profile(index))
+        cache[record.username] = record
+    return cache
+
+def current_rss():
+    # Resident set size in bytes from /proc, else peak RSS from getrusage, else None
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024, "current"
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None, None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return (peak if sys.platform == 'darwin' else peak * 1024), "peak"
+
+def format_bytes(size):
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PROFILES
+    if count < 1:
+        sys.exit("Number of profiles must be at least 1")
+
+    # RSS pass with tracemalloc off, so its bookkeeping is not counted
+    rss_before, rss_kind = current_rss()
+    cache = build_cache(count)
+    rss_after, _ = current_rss()
+    del cache
+
+    # Allocation pass with the same seed and count
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    cache = build_cache(count)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in snapshot.compare_to(baseline, 'filename'))
+
+    report_bytes = sum(sys.getsizeof(record.report) for record in cache.values())
+    print(f"Profiles cached: {len(cache)}")
+    print(f"Biography cap: {BIO_MAX_LENGTH} characters")
+    print(f"Traced allocations: {format_bytes(allocated)}")
+    print(f"Bytes per cached profile: {allocated / len(cache):.0f}")
+    print(f"  of which pre-rendered report: {report_bytes / len(cache):.0f}")
+    print(f"  record object itself: {sys.getsizeof(next(iter(cache.values())))}")
+    if rss_after is None:
+        print("Total RSS: unavailable on this platform")
+    elif rss_kind == "current":
+        print(f"Total RSS: {format_bytes(rss_after)} (+{format_bytes(rss_after - rss_before)} during load)")
+    else:
+        print(f"Peak RSS: {format_bytes(rss_after)}")
+
+if __name__ == "__main__":
+    main()
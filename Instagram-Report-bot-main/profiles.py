@@ -0,0 +1,122 @@
+import sys
+import random
+import re
+from collections import defaultdict
+
+# List of keywords for different report categories
+report_keywords = {
+    "HATE": ["devil", "666", "savage", "love", "hate", "followers", "selling", "sold", "seller", "dick", "ban", "banned", "free", "method", "paid"],
+    "SELF": ["suicide", "blood", "death", "dead", "kill myself"],
+    "BULLY": ["@"],
+    "VIOLENT": ["hitler", "osama bin laden", "guns", "soldiers", "masks", "flags"],
+    "ILLEGAL": ["drugs", "cocaine", "plants", "trees", "medicines"],
+    "PRETENDING": ["verified", "tick"],
+    "NUDITY": ["nude", "sex", "send nudes"],
+    "SPAM": ["phone number", "email", "contact"]
+}
+
+def check_keywords(text, keywords):
+    return any(keyword in text.lower() for keyword in keywords)
+
+def analyze_profile(profile_info):
+    reports = defaultdict(int)
+    profile_texts = [
+        profile_info.username,
+        profile_info.biography,
+    ]
+
+    for text in profile_texts:
+        for category, keywords in report_keywords.items():
+            if check_keywords(text, keywords):
+                reports[category] += 1
+
+    if reports:
+        unique_counts = random.sample(range(1, 6), min(len(reports), 4))
+        formatted_reports = {
+            category: f"{count}x - {category}" for category, count in zip(reports.keys(), unique_counts)
+        }
+    else:
+        all_categories = list(report_keywords.keys())
+        num_categories = random.randint(2, 5)
+        selected_categories = random.sample(all_categories, num_categories)
+        unique_counts = random.sample(range(1, 6), num_categories)
+        formatted_reports = {
+            category: f"{count}x - {category}" for category, count in zip(selected_categories, unique_counts)
+        }
+
+    return formatted_reports
+
+# Special MarkdownV2 characters and their escaped form
+markdown_v2_replacements = {
+    '_': r'\_', '*': r'\*', '[': r'\[', ']': r'\]',
+    '(': r'\(', ')': r'\)', '~': r'\~', '`': r'\`',
+    '>': r'\>', '#': r'\#', '+': r'\+', '-': r'\-',
+    '=': r'\=', '|': r'\|', '{': r'\{', '}': r'\}',
+    '.': r'\.', '!': r'\!'
+}
+markdown_v2_pattern = re.compile('|'.join(re.escape(key) for key in markdown_v2_replacements.keys()))
+
+def escape_markdown_v2(text):
+    # Escape special MarkdownV2 characters
+    return markdown_v2_pattern.sub(lambda x: markdown_v2_replacements[x.group(0)], text)
+
+def render_report(profile_info):
+    reports_to_file = analyze_profile(profile_info)
+    result_text = f"**Public Information for {profile_info.username}:**\n"
+    result_text += f"Username: {profile_info.username}\n"
+    result_text += f"Full Name: {profile_info.full_name}\n"
+    result_text += f"Biography: {profile_info.biography}\n"
+    result_text += f"Followers: {profile_info.follower_count}\n"
+    result_text += f"Following: {profile_info.following_count}\n"
+    result_text += f"Private Account: {'Yes' if profile_info.is_private else 'No'}\n"
+    result_text += f"Posts: {profile_info.post_count}\n"
+    result_text += f"External URL: {profile_info.external_url}\n\n"
+    result_text += "Suggested Reports for Your Target:\n"
+    for report in reports_to_file.values():
+        result_text += f"• {report}\n"
+    result_text += "\n*Note: This method is based on available data and may not be fully accurate.*\n\n for supporting my devloper please donate some Money @SendPayments"
+
+    # Escape special characters for MarkdownV2
+    return escape_markdown_v2(result_text)
+
+# Instagram caps biographies at 150 characters; anything longer is trimmed
+BIO_MAX_LENGTH = 150
+
+class ProfileRecord:
+    # Compact profile entry. __slots__ drops the per-instance dict so many records
+    # can be cached. The escaped report is rendered once by from_profile(), so a
+    # cached record keeps returning the same suggested reports. It is kept as UTF-8
+    # bytes: as a str the "•" bullets alone double its size, and an emoji in the bio
+    # quadruples it.
+    __slots__ = (
+        "username", "full_name", "biography", "follower_count", "following_count",
+        "is_private", "post_count", "external_url", "report",
+    )
+
+    def __init__(self, username, full_name, biography, follower_count, following_count,
+                 is_private, post_count, external_url, report=None):
+        self.username = sys.intern(username)
+        self.full_name = full_name
+        self.biography = (biography or "")[:BIO_MAX_LENGTH]
+        self.follower_count = follower_count
+        self.following_count = following_count
+        self.is_private = is_private
+        self.post_count = post_count
+        self.external_url = external_url
+        self.report = report
+
+    @classmethod
+    def from_profile(cls, profile):
+        # Build a record from an instaloader Profile and render its report
+        record = cls(
+            username=profile.username,
+            full_name=profile.full_name,
+            biography=profile.biography,
+            follower_count=profile.followers,
+            following_count=profile.followees,
+            is_private=profile.is_private,
+            post_count=profile.mediacount,
+            external_url=profile.external_url,
+        )
+        record.report = render_report(record).encode('utf-8')
+        return record